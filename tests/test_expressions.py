@@ -1,8 +1,10 @@
 # ruff: noqa: E501
 
-import warnings
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
 from typing import Any, Concatenate, ParamSpec
 
 import numpy as np
@@ -15,85 +17,84 @@ from polars_st.geometry import GeometryType, PolarsGeometryType
 
 empty_frame = pl.Series("geometry", [], pl.Binary()).to_frame()
 none_frame = pl.Series("geometry", [None], pl.Binary()).to_frame()
-
-point_empty = st.GeoDataFrame(["POINT EMPTY"])
-point_2d = st.GeoDataFrame(["POINT (1 2)"])
-point_3d = st.GeoDataFrame(["POINT (1 2 3)"])
-line_empty = st.GeoDataFrame(["LINESTRING EMPTY"])
-line_2d = st.GeoDataFrame(["LINESTRING (0 0, 1 1)"])
-line_3d = st.GeoDataFrame(["LINESTRING Z (0 0 0, 1 1 1, 2 2 2)"])
-poly_empty = st.GeoDataFrame(["POLYGON EMPTY"])
-poly_2d = st.GeoDataFrame(["POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))"])
-poly_3d = st.GeoDataFrame(["POLYGON Z ((0 0 1, 1 0 0, 1 1 1, 0 1 0, 0 0 1))"])
-multipoint_empty = st.GeoDataFrame(["MULTIPOINT EMPTY"])
-multipoint_2d = st.GeoDataFrame(["MULTIPOINT ((0 0), (1 1))"])
-multipoint_3d = st.GeoDataFrame(["MULTIPOINT Z ((0 0 0), (1 1 1))"])
-multiline_empty = st.GeoDataFrame(["MULTILINESTRING EMPTY"])
-multiline_2d = st.GeoDataFrame(["MULTILINESTRING ((0 0, 1 1), (2 2, 3 3))"])
-multiline_3d = st.GeoDataFrame(["MULTILINESTRING Z ((0 0 0, 1 1 1), (2 2 2, 3 3 3))"])
-multipoly_empty = st.GeoDataFrame(["MULTIPOLYGON EMPTY"])
-multipoly_2d = st.GeoDataFrame(["MULTIPOLYGON (((0 0, 1 0, 0 1, 0 0)), ((2 2, 3 2, 2 3, 2 2)))"])
-multipoly_3d = st.GeoDataFrame([
-    "MULTIPOLYGON Z (((0 0 0, 1 0 0, 0 1 1, 0 0 0)), ((2 2 2, 3 2 3, 2 3 2, 2 2 2)))",
-])
-collection_empty = st.GeoDataFrame(["GEOMETRYCOLLECTION EMPTY"])
-collection_2d = st.GeoDataFrame(["GEOMETRYCOLLECTION (POINT (0 0), LINESTRING (0 0, 1 1))"])
-collection_3d = st.GeoDataFrame([
-    "GEOMETRYCOLLECTION (POINT (0 0), LINESTRING (0 0, 1 1), POLYGON ((0 0, 1 0, 1 1, 0 0)))",
-])
-collection_mixed = st.GeoDataFrame([
-    "GEOMETRYCOLLECTION (POINT Z (0 0 0), LINESTRING (0 0, 1 1), POLYGON ((0 0, 1 0, 1 1, 0 0)))",
-])
-
-base_types = [
-    point_empty,
-    point_2d,
-    point_3d,
-    line_empty,
-    line_2d,
-    line_3d,
-    poly_empty,
-    poly_2d,
-    poly_3d,
-    multipoint_empty,
-    multipoint_2d,
-    multipoint_3d,
-    multiline_empty,
-    multiline_2d,
-    multiline_3d,
-    multipoly_empty,
-    multipoly_2d,
-    multipoly_3d,
-    collection_empty,
-    collection_2d,
-    collection_3d,
-    collection_mixed,
-]
-
-dummy_point = point_2d.item()
-dummy_line = line_2d.item()
+empty_list_frame = empty_frame.group_by(0).agg(st.geom())
+none_list_frame = none_frame.group_by(0).agg(st.geom())
+
+base_wkt = {
+    "point_empty": "POINT EMPTY",
+    "point_2d": "POINT (1 2)",
+    "point_3d": "POINT (1 2 3)",
+    "line_empty": "LINESTRING EMPTY",
+    "line_2d": "LINESTRING (0 0, 1 1)",
+    "line_3d": "LINESTRING Z (0 0 0, 1 1 1, 2 2 2)",
+    "poly_empty": "POLYGON EMPTY",
+    "poly_2d": "POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))",
+    "poly_3d": "POLYGON Z ((0 0 1, 1 0 0, 1 1 1, 0 1 0, 0 0 1))",
+    "multipoint_empty": "MULTIPOINT EMPTY",
+    "multipoint_2d": "MULTIPOINT ((0 0), (1 1))",
+    "multipoint_3d": "MULTIPOINT Z ((0 0 0), (1 1 1))",
+    "multiline_empty": "MULTILINESTRING EMPTY",
+    "multiline_2d": "MULTILINESTRING ((0 0, 1 1), (2 2, 3 3))",
+    "multiline_3d": "MULTILINESTRING Z ((0 0 0, 1 1 1), (2 2 2, 3 3 3))",
+    "multipoly_empty": "MULTIPOLYGON EMPTY",
+    "multipoly_2d": "MULTIPOLYGON (((0 0, 1 0, 0 1, 0 0)), ((2 2, 3 2, 2 3, 2 2)))",
+    "multipoly_3d": "MULTIPOLYGON Z (((0 0 0, 1 0 0, 0 1 1, 0 0 0)), ((2 2 2, 3 2 3, 2 3 2, 2 2 2)))",
+    "collection_empty": "GEOMETRYCOLLECTION EMPTY",
+    "collection_2d": "GEOMETRYCOLLECTION (POINT (0 0), LINESTRING (0 0, 1 1))",
+    "collection_3d": "GEOMETRYCOLLECTION (POINT (0 0), LINESTRING (0 0, 1 1), POLYGON ((0 0, 1 0, 1 1, 0 0)))",
+    "collection_mixed": "GEOMETRYCOLLECTION (POINT Z (0 0 0), LINESTRING (0 0, 1 1), POLYGON ((0 0, 1 0, 1 1, 0 0)))",
+}
+
+
+@cache
+def base_frames() -> dict[str, pl.DataFrame]:
+    """Parse all base geometries in a single batch, on first use."""
+    frame = st.GeoDataFrame(list(base_wkt.values()))
+    return dict(zip(base_wkt, frame.iter_slices(1), strict=True))
+
+
+dummy_point, dummy_line, collection_empty = st.GeoDataFrame([
+    "POINT (1 2)",
+    "LINESTRING (0 0, 1 1)",
+    "GEOMETRYCOLLECTION EMPTY",
+]).get_column("geometry")
 
 P = ParamSpec("P")
 FunctionCallable = Callable[Concatenate[Geo, P], pl.Expr]
 
+interned_args: dict[tuple[tuple[str, type, Any], ...], Mapping[str, Any]] = {}
+
+
+def intern_args(**kwargs: Any) -> Mapping[str, Any]:
+    """Return a read-only mapping of `kwargs`, shared between identical argument sets."""
+    kwargs = {k: tuple(v) if isinstance(v, list) else v for k, v in kwargs.items()}
+    key = tuple(sorted((k, type(v), v) for k, v in kwargs.items()))
+    return interned_args.setdefault(key, MappingProxyType(kwargs))
 
-@dataclass()
+
+@dataclass(repr=False)
 class Function:
     call: FunctionCallable
     dtype: pl.DataType
-    args: dict[str, Any] = field(default_factory=dict)
+    args: Mapping[str, Any] = field(default_factory=intern_args)
 
     def __call__(self):
         return self.call(st.geom().st, **self.args)
 
+    def __repr__(self):
+        args = ",".join(
+            f"{k}=<wkb>" if isinstance(v, bytes) else f"{k}={v!r:.20}" for k, v in self.args.items()
+        )
+        return f"{self.call.__name__}({args})"
+
 
-functions = [
+functions = (
     Function(Geo.geometry_type, PolarsGeometryType),
     Function(Geo.dimensions, pl.Int32()),
     Function(Geo.coordinate_dimension, pl.UInt32()),
     Function(Geo.srid, pl.Int32()),
-    Function(Geo.set_srid, pl.Binary(), {"srid": 3857}),
-    Function(Geo.to_srid, pl.Binary(), {"srid": 3857}),
+    Function(Geo.set_srid, pl.Binary(), intern_args(srid=3857)),
+    Function(Geo.to_srid, pl.Binary(), intern_args(srid=3857)),
     Function(Geo.x, pl.Float64()),
     Function(Geo.y, pl.Float64()),
     Function(Geo.z, pl.Float64()),
@@ -102,15 +103,15 @@ functions = [
     Function(Geo.count_points, pl.UInt32()),
     Function(Geo.count_interior_rings, pl.UInt32()),
     Function(Geo.count_geometries, pl.UInt32()),
-    Function(Geo.get_point, pl.Binary(), {"index": 0}),
-    Function(Geo.get_interior_ring, pl.Binary(), {"index": 0}),
-    Function(Geo.get_geometry, pl.Binary(), {"index": 0}),
+    Function(Geo.get_point, pl.Binary(), intern_args(index=0)),
+    Function(Geo.get_interior_ring, pl.Binary(), intern_args(index=0)),
+    Function(Geo.get_geometry, pl.Binary(), intern_args(index=0)),
     Function(Geo.parts, pl.List(pl.Binary())),
     Function(Geo.interior_rings, pl.List(pl.Binary())),
     Function(Geo.precision, pl.Float64()),
-    Function(Geo.set_precision, pl.Binary(), {"grid_size": 1.0, "mode": "valid_output"}),
-    Function(Geo.set_precision, pl.Binary(), {"grid_size": 1.0, "mode": "no_topo"}),
-    Function(Geo.set_precision, pl.Binary(), {"grid_size": 1.0, "mode": "keep_collapsed"}),
+    Function(Geo.set_precision, pl.Binary(), intern_args(grid_size=1.0, mode="valid_output")),
+    Function(Geo.set_precision, pl.Binary(), intern_args(grid_size=1.0, mode="no_topo")),
+    Function(Geo.set_precision, pl.Binary(), intern_args(grid_size=1.0, mode="keep_collapsed")),
     Function(Geo.to_wkt, pl.String()),
     Function(Geo.to_ewkt, pl.String()),
     Function(Geo.to_wkb, pl.Binary()),
@@ -120,11 +121,11 @@ functions = [
     Function(Geo.area, pl.Float64()),
     Function(Geo.bounds, pl.Array(pl.Float64, 4)),
     Function(Geo.length, pl.Float64()),
-    Function(Geo.distance, pl.Float64(), {"other": dummy_point}),
-    Function(Geo.hausdorff_distance, pl.Float64(), {"other": dummy_point, "densify": None}),
-    Function(Geo.hausdorff_distance, pl.Float64(), {"other": dummy_point, "densify": 0.5}),
-    Function(Geo.frechet_distance, pl.Float64(), {"other": dummy_point, "densify": None}),
-    Function(Geo.frechet_distance, pl.Float64(), {"other": dummy_point, "densify": 0.5}),
+    Function(Geo.distance, pl.Float64(), intern_args(other=dummy_point)),
+    Function(Geo.hausdorff_distance, pl.Float64(), intern_args(other=dummy_point, densify=None)),
+    Function(Geo.hausdorff_distance, pl.Float64(), intern_args(other=dummy_point, densify=0.5)),
+    Function(Geo.frechet_distance, pl.Float64(), intern_args(other=dummy_point, densify=None)),
+    Function(Geo.frechet_distance, pl.Float64(), intern_args(other=dummy_point, densify=0.5)),
     Function(Geo.minimum_clearance, pl.Float64()),
     Function(Geo.has_z, pl.Boolean()),
     Function(Geo.has_m, pl.Boolean()),
@@ -135,44 +136,44 @@ functions = [
     Function(Geo.is_simple, pl.Boolean()),
     Function(Geo.is_valid, pl.Boolean()),
     Function(Geo.is_valid_reason, pl.String()),
-    Function(Geo.crosses, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.contains, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.contains_properly, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.covered_by, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.covers, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.disjoint, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.dwithin, pl.Boolean(), {"other": dummy_point, "distance": 1.0}),
-    Function(Geo.intersects, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.overlaps, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.touches, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.within, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.equals, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.equals_exact, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.equals_identical, pl.Boolean(), {"other": dummy_point}),
-    Function(Geo.relate, pl.String(), {"other": dummy_point}),
-    Function(Geo.relate_pattern, pl.Boolean(), {"other": dummy_point, "pattern": "*********"}),
-    Function(Geo.difference, pl.Binary(), {"other": dummy_point, "grid_size": None}),
-    Function(Geo.difference, pl.Binary(), {"other": dummy_point, "grid_size": 0.5}),
-    Function(Geo.intersection, pl.Binary(), {"other": dummy_point, "grid_size": None}),
-    Function(Geo.intersection, pl.Binary(), {"other": dummy_point, "grid_size": 0.5}),
-    Function(Geo.symmetric_difference, pl.Binary(), {"other": dummy_point, "grid_size": None}),
-    Function(Geo.symmetric_difference, pl.Binary(), {"other": dummy_point, "grid_size": 0.5}),
-    Function(Geo.union, pl.Binary(), {"other": dummy_point, "grid_size": None}),
-    Function(Geo.union, pl.Binary(), {"other": dummy_point, "grid_size": 0.5}),
-    Function(Geo.unary_union, pl.Binary(), {"grid_size": None}),
-    Function(Geo.unary_union, pl.Binary(), {"grid_size": 0.5}),
-    Function(Geo.cast, pl.Binary(), {"into": "GeometryCollection"}),
+    Function(Geo.crosses, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.contains, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.contains_properly, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.covered_by, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.covers, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.disjoint, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.dwithin, pl.Boolean(), intern_args(other=dummy_point, distance=1.0)),
+    Function(Geo.intersects, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.overlaps, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.touches, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.within, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.equals, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.equals_exact, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.equals_identical, pl.Boolean(), intern_args(other=dummy_point)),
+    Function(Geo.relate, pl.String(), intern_args(other=dummy_point)),
+    Function(Geo.relate_pattern, pl.Boolean(), intern_args(other=dummy_point, pattern="*********")),
+    Function(Geo.difference, pl.Binary(), intern_args(other=dummy_point, grid_size=None)),
+    Function(Geo.difference, pl.Binary(), intern_args(other=dummy_point, grid_size=0.5)),
+    Function(Geo.intersection, pl.Binary(), intern_args(other=dummy_point, grid_size=None)),
+    Function(Geo.intersection, pl.Binary(), intern_args(other=dummy_point, grid_size=0.5)),
+    Function(Geo.symmetric_difference, pl.Binary(), intern_args(other=dummy_point, grid_size=None)),
+    Function(Geo.symmetric_difference, pl.Binary(), intern_args(other=dummy_point, grid_size=0.5)),
+    Function(Geo.union, pl.Binary(), intern_args(other=dummy_point, grid_size=None)),
+    Function(Geo.union, pl.Binary(), intern_args(other=dummy_point, grid_size=0.5)),
+    Function(Geo.unary_union, pl.Binary(), intern_args(grid_size=None)),
+    Function(Geo.unary_union, pl.Binary(), intern_args(grid_size=0.5)),
+    Function(Geo.cast, pl.Binary(), intern_args(into="GeometryCollection")),
     Function(Geo.multi, pl.Binary()),
     Function(Geo.boundary, pl.Binary()),
     Function(Geo.coverage_union, pl.Binary()),
-    Function(Geo.buffer, pl.Binary(), {"distance": 1.0}),
-    Function(Geo.offset_curve, pl.Binary(), {"distance": 1.0}),
+    Function(Geo.buffer, pl.Binary(), intern_args(distance=1.0)),
+    Function(Geo.offset_curve, pl.Binary(), intern_args(distance=1.0)),
     Function(Geo.centroid, pl.Binary()),
     Function(Geo.center, pl.Binary()),
-    Function(Geo.clip_by_rect, pl.Binary(), {"bounds": [0.0, 0.0, 1.0, 1.0]}),
+    Function(Geo.clip_by_rect, pl.Binary(), intern_args(bounds=[0.0, 0.0, 1.0, 1.0])),
     Function(Geo.concave_hull, pl.Binary()),
     Function(Geo.convex_hull, pl.Binary()),
-    Function(Geo.segmentize, pl.Binary(), {"max_segment_length": 1.0}),
+    Function(Geo.segmentize, pl.Binary(), intern_args(max_segment_length=1.0)),
     Function(Geo.envelope, pl.Binary()),
     Function(Geo.extract_unique_points, pl.Binary()),
     Function(Geo.build_area, pl.Binary()),
@@ -182,71 +183,53 @@ functions = [
     Function(Geo.point_on_surface, pl.Binary()),
     Function(Geo.remove_repeated_points, pl.Binary()),
     Function(Geo.reverse, pl.Binary()),
-    Function(Geo.snap, pl.Binary(), {"other": dummy_point, "tolerance": 1.0}),
-    Function(Geo.simplify, pl.Binary(), {"tolerance": 1.0, "preserve_topology": False}),
-    Function(Geo.simplify, pl.Binary(), {"tolerance": 1.0, "preserve_topology": True}),
+    Function(Geo.snap, pl.Binary(), intern_args(other=dummy_point, tolerance=1.0)),
+    Function(Geo.simplify, pl.Binary(), intern_args(tolerance=1.0, preserve_topology=False)),
+    Function(Geo.simplify, pl.Binary(), intern_args(tolerance=1.0, preserve_topology=True)),
     Function(Geo.flip_coordinates, pl.Binary()),
     Function(Geo.minimum_rotated_rectangle, pl.Binary()),
     Function(Geo.translate, pl.Binary()),
-    Function(Geo.rotate, pl.Binary(), {"angle": 90}),
+    Function(Geo.rotate, pl.Binary(), intern_args(angle=90)),
     Function(Geo.scale, pl.Binary()),
     Function(Geo.skew, pl.Binary()),
-    Function(Geo.interpolate, pl.Binary(), {"distance": 1.0, "normalized": False}),
-    Function(Geo.interpolate, pl.Binary(), {"distance": 1.0, "normalized": True}),
-    Function(Geo.project, pl.Float64(), {"other": dummy_point, "normalized": False}),
-    Function(Geo.project, pl.Float64(), {"other": dummy_point, "normalized": True}),
-    Function(Geo.substring, pl.Binary(), {"start": 0.0, "end": 0.0}),
-    Function(Geo.line_merge, pl.Binary(), {"directed": True}),
-    Function(Geo.line_merge, pl.Binary(), {"directed": False}),
-    Function(Geo.shared_paths, pl.Binary(), {"other": dummy_line}),
-    Function(Geo.shortest_line, pl.Binary(), {"other": dummy_point}),
+    Function(Geo.interpolate, pl.Binary(), intern_args(distance=1.0, normalized=False)),
+    Function(Geo.interpolate, pl.Binary(), intern_args(distance=1.0, normalized=True)),
+    Function(Geo.project, pl.Float64(), intern_args(other=dummy_point, normalized=False)),
+    Function(Geo.project, pl.Float64(), intern_args(other=dummy_point, normalized=True)),
+    Function(Geo.substring, pl.Binary(), intern_args(start=0.0, end=0.0)),
+    Function(Geo.line_merge, pl.Binary(), intern_args(directed=True)),
+    Function(Geo.line_merge, pl.Binary(), intern_args(directed=False)),
+    Function(Geo.shared_paths, pl.Binary(), intern_args(other=dummy_line)),
+    Function(Geo.shortest_line, pl.Binary(), intern_args(other=dummy_point)),
     Function(Geo.count_coordinates, pl.UInt32()),
     Function(Geo.coordinates, pl.List(pl.List(pl.Float64))),
-]
+)
 
 
-@dataclass()
+@dataclass(repr=False)
 class Aggregate:
     call: FunctionCallable
     dtype: pl.DataType
     identity: Any
 
-
-aggregates = [
-    Aggregate(Geo.voronoi_polygons, pl.Binary(), collection_empty.item()),
-    Aggregate(Geo.delaunay_triangles, pl.Binary(), collection_empty.item()),
-    Aggregate(Geo.polygonize, pl.Binary(), collection_empty.item()),
-    Aggregate(Geo.total_bounds, pl.Array(pl.Float64(), 4), np.full(4, np.nan)),
-    Aggregate(Geo.intersection_all, pl.Binary(), collection_empty.item()),
-    Aggregate(Geo.symmetric_difference_all, pl.Binary(), collection_empty.item()),
-    Aggregate(Geo.union_all, pl.Binary(), collection_empty.item()),
-    Aggregate(Geo.coverage_union_all, pl.Binary(), collection_empty.item()),
-    Aggregate(Geo.collect, pl.Binary(), collection_empty.item()),
-]
-
-
-@pytest.mark.parametrize("frame", [empty_frame])
-@pytest.mark.parametrize("func", functions)
-def test_functions_empty_frame(frame: pl.DataFrame, func: Function):
-    """Functions should work on empty frames."""
-    result = frame.select(func())
-    assert result.schema == pl.Schema([("geometry", func.dtype)])
-    assert len(result) == 0
+    def __repr__(self):
+        return self.call.__name__
 
 
-@pytest.mark.parametrize("frame", [none_frame])
-@pytest.mark.parametrize("func", functions)
-def test_functions_none_frame(frame: pl.DataFrame, func: Function):
-    """Functions should work on full-null frames."""
-    result = frame.select(func())
-    assert result.schema == pl.Schema([("geometry", func.dtype)])
-    assert len(result) == 1
-    assert result.item() is None
+aggregates = (
+    Aggregate(Geo.voronoi_polygons, pl.Binary(), collection_empty),
+    Aggregate(Geo.delaunay_triangles, pl.Binary(), collection_empty),
+    Aggregate(Geo.polygonize, pl.Binary(), collection_empty),
+    Aggregate(Geo.total_bounds, pl.Array(pl.Float64(), 4), np.full(4, np.nan)),
+    Aggregate(Geo.intersection_all, pl.Binary(), collection_empty),
+    Aggregate(Geo.symmetric_difference_all, pl.Binary(), collection_empty),
+    Aggregate(Geo.union_all, pl.Binary(), collection_empty),
+    Aggregate(Geo.coverage_union_all, pl.Binary(), collection_empty),
+    Aggregate(Geo.collect, pl.Binary(), collection_empty),
+)
 
 
-@pytest.mark.parametrize("frame", [empty_frame])
-@pytest.mark.parametrize("func", functions)
-def test_functions_empty_frame_agg(frame: pl.DataFrame, func: Function):
+def check_empty_frame_agg(frame: pl.DataFrame, func: Function):
     """Functions should work on empty frames in aggregation context."""
     # Should file a bug report in polars for that (cannot concatenate empty list of arrays)
     if func.call == Geo.bounds:
@@ -256,9 +239,7 @@ def test_functions_empty_frame_agg(frame: pl.DataFrame, func: Function):
     assert len(result) == 0
 
 
-@pytest.mark.parametrize("frame", [none_frame])
-@pytest.mark.parametrize("func", functions)
-def test_functions_none_frame_agg(frame: pl.DataFrame, func: Function):
+def check_none_frame_agg(frame: pl.DataFrame, func: Function):
     """Functions should work on full-null frames in aggregation context."""
     # Skip since List(Object) is not supported
     if func.call in {Geo.to_dict, Geo.to_shapely}:
@@ -270,9 +251,7 @@ def test_functions_none_frame_agg(frame: pl.DataFrame, func: Function):
     assert result.get_column("geometry").list.get(0).item() is None
 
 
-@pytest.mark.parametrize("frame", [empty_frame.group_by(0).agg(st.geom())])
-@pytest.mark.parametrize("func", functions)
-def test_functions_empty_list_frame(frame: pl.DataFrame, func: Function):
+def check_empty_list_frame(frame: pl.DataFrame, func: Function):
     """Functions should work on empty lists."""
     # Skip since List(Object) is not supported
     if func.call in {Geo.to_dict, Geo.to_shapely}:
@@ -282,9 +261,7 @@ def test_functions_empty_list_frame(frame: pl.DataFrame, func: Function):
     assert len(result) == 0
 
 
-@pytest.mark.parametrize("frame", [none_frame.group_by(0).agg(st.geom())])
-@pytest.mark.parametrize("func", functions)
-def test_functions_none_list_frame(frame: pl.DataFrame, func: Function):
+def check_none_list_frame(frame: pl.DataFrame, func: Function):
     """Functions should work on full-null lists."""
     # Skip since List(Object) is not supported
     if func.call in {Geo.to_dict, Geo.to_shapely}:
@@ -294,29 +271,76 @@ def test_functions_none_list_frame(frame: pl.DataFrame, func: Function):
     assert result.item().item() is None
 
 
+modes = [
+    pytest.param(empty_frame, check_empty_frame_agg, id="empty_frame_agg"),
+    pytest.param(none_frame, check_none_frame_agg, id="none_frame_agg"),
+    pytest.param(empty_list_frame, check_empty_list_frame, id="empty_list_frame"),
+    pytest.param(none_list_frame, check_none_list_frame, id="none_list_frame"),
+]
+
+
+@pytest.mark.parametrize("frame", [empty_frame, none_frame], ids=["empty_frame", "none_frame"])
+def test_functions_null_frames_fused(frame: pl.DataFrame):
+    """Functions should work on empty and full-null frames."""
+    # Object columns (to_dict, to_shapely) are supported outside lists and aggregations, so they
+    # stay in the fused select.
+    exprs = {f"c{i}": func() for i, func in enumerate(functions)}
+    try:
+        result = frame.select(**exprs)
+    except Exception:
+        # Replay each function on its own so that the failing one gets reported
+        for func in functions:
+            frame.select(func())
+        raise
+
+    assert len(result) == len(frame)
+    bad = [
+        repr(func)
+        for name, func in zip(exprs, functions, strict=True)
+        if result.schema[name] != func.dtype
+        or result.get_column(name).to_list() != [None] * len(frame)
+    ]
+    assert not bad, bad
+
+
+@pytest.mark.parametrize(("frame", "check"), modes)
+@pytest.mark.parametrize("func", functions, ids=repr)
+def test_functions_null_frames(
+    frame: pl.DataFrame,
+    check: Callable[[pl.DataFrame, Function], None],
+    func: Function,
+):
+    """Functions should work on empty and full-null lists and in aggregation context."""
+    check(frame, func)
+
+
 @pytest.mark.parametrize("frame", [none_frame, empty_frame])
-@pytest.mark.parametrize("func", aggregates)
+@pytest.mark.parametrize("func", aggregates, ids=repr)
 def test_aggregates(frame: pl.DataFrame, func: Aggregate):
     """Aggregations should work on empty and full-null frames."""
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", message="invalid value encountered in coverage_union")
-        result = frame.select(func.call(st.geom().st))
+    result = frame.select(func.call(st.geom().st))
     assert result.schema == pl.Schema([("geometry", func.dtype)])
     assert len(result) == 1
     item = result.item()
-    if isinstance(item, pl.Series):
+    if isinstance(func.identity, np.ndarray):
         # item() returns a series if dtype is List or Array (for st.total_bounds)
         assert np.array_equal(item.to_numpy(), func.identity, equal_nan=True)
     else:
         assert item == func.identity
 
 
-@pytest.mark.parametrize("frame", base_types)
-@pytest.mark.parametrize("func", functions)
-def test_functions_all_types_frame(frame: pl.DataFrame, func: Function):  # noqa: C901, PLR0912
-    """Functions should work on every geometry type."""
-    geom_type: GeometryType = frame.select(st.geometry_type()).item()
-    geom_empty: bool = frame.select(st.is_empty()).item()
+@cache
+def frame_meta() -> dict[str, tuple[GeometryType, bool]]:
+    """Return the geometry type and emptiness of each base geometry."""
+    return {
+        name: (frame.select(st.geometry_type()).item(), frame.select(st.is_empty()).item())
+        for name, frame in base_frames().items()
+    }
+
+
+def expected_error(name: str, func: Function) -> str | None:  # noqa: C901
+    """Return the error message expected when calling `func` on base geometry `name`, if any."""
+    geom_type, geom_empty = frame_meta()[name]
     error = None
 
     if (
@@ -333,7 +357,7 @@ def test_functions_all_types_frame(frame: pl.DataFrame, func: Function):  # noqa
     ):
         error = "IllegalArgumentException: Overlay input is mixed-dimension"
 
-    if func.call == Geo.coverage_union and frame is collection_mixed:
+    if func.call == Geo.coverage_union and name == "collection_mixed":
         error = "IllegalArgumentException: Overlay input is mixed-dimension"
 
     if func.call == Geo.shared_paths and geom_type not in {"LineString", "MultiLineString"}:
@@ -383,6 +407,26 @@ def test_functions_all_types_frame(frame: pl.DataFrame, func: Function):  # noqa
     }:
         error = "Geometry must be a collection"
 
+    return error
+
+
+@cache
+def expected_errors() -> dict[tuple[str, int], re.Pattern[str] | None]:
+    """Return the compiled expected error of every (base geometry, function) pair."""
+    errors = {
+        (name, id(func)): expected_error(name, func) for name in base_wkt for func in functions
+    }
+    patterns = {error: re.compile(error) for error in set(errors.values()) if error is not None}
+    return {key: None if error is None else patterns[error] for key, error in errors.items()}
+
+
+@pytest.mark.parametrize("name", list(base_wkt))
+@pytest.mark.parametrize("func", functions, ids=repr)
+def test_functions_all_types_frame(name: str, func: Function):
+    """Functions should work on every geometry type."""
+    frame = base_frames()[name]
+    error = expected_errors()[name, id(func)]
+
     if func.call == Geo.to_srid:
         frame = frame.select(st.geom().st.set_srid(4326))
 
@@ -391,8 +435,6 @@ def test_functions_all_types_frame(frame: pl.DataFrame, func: Function):  # noqa
             frame.select(func())
         return
 
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", message="invalid value encountered in voronoi_polygons")
-        result = frame.select(func())
+    result = frame.select(func())
 
     assert result.schema == pl.Schema([("geometry", func.dtype)])